@@ -9,10 +9,17 @@
 
 import inspect
 import logging
+from functools import lru_cache
 
 LOG = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _signature(func):
+    # the decorated functions are created once, so their signatures can be cached
+    return inspect.signature(func)
+
+
 class ArgsKwargs:
     def __init__(self, args, kwargs, func=None):
         assert isinstance(kwargs, dict)
@@ -30,7 +37,7 @@ class ArgsKwargs:
         new_args = []
         new_kwargs = {}
 
-        sig = inspect.signature(self.func)
+        sig = _signature(self.func)
         bnd = sig.bind(*self.args, **self.kwargs)
         parameters_names = list(sig.parameters)
 
@@ -80,6 +80,11 @@ class InputManager:
             a.add_format_transformers(self._pipeline)
 
     def apply_to_kwargs_before_default(self, kwargs):
+        if not LOG.isEnabledFor(logging.DEBUG):
+            for t in self.pipeline:
+                kwargs = t.execute_before_default(kwargs)
+            return kwargs
+
         LOG.debug(f"Apply pipeline to kwargs before resolving default values: {safe_to_str(kwargs)}")
         for t in self.pipeline:
             if hasattr(t, "name"):
@@ -93,6 +98,11 @@ class InputManager:
         return kwargs
 
     def apply_to_kwargs(self, kwargs):
+        if not LOG.isEnabledFor(logging.DEBUG):
+            for t in self.pipeline:
+                kwargs = t.execute(kwargs)
+            return kwargs
+
         LOG.debug(f"Apply pipeline to kwargs: {safe_to_str(kwargs)}")
         for t in self.pipeline:
             if hasattr(t, "name"):
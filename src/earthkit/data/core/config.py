@@ -171,6 +171,13 @@ CONFIG_AND_HELP = {
         """Number of threads used to download data.""",
         getter="_as_int",
     ),
+    "maximum-cds-download-threads": _(
+        6,
+        """Maximum number of threads used to download data from the CDS and ADS.
+        These services only run a limited number of requests per user at the
+        same time, so ``number-of-download-threads`` is capped at this value.""",
+        getter="_as_int",
+    ),
     "cache-policy": _(
         "off",
         """Caching policy. {validator}
@@ -8,7 +8,6 @@
 #
 
 import functools
-import itertools
 import logging
 from abc import ABCMeta
 from abc import abstractmethod
@@ -21,32 +20,40 @@ from earthkit.data.core.index import normalize_selection
 LOG = logging.getLogger(__name__)
 
 
-def coords_to_index(coords, shape) -> int:
+def shape_to_strides(shape):
     """
-    Map user coords to field index"""
-    index = 0
-    n = 1
-    for i in range(len(coords) - 1, -1, -1):
-        index += coords[i] * n
-        n *= shape[i]
-    return index
+    Compute the strides (in number of fields) of a C-ordered hypercube"""
+    strides = [1] * len(shape)
+    for i in range(len(shape) - 1, 0, -1):
+        strides[i - 1] = strides[i] * shape[i]
+    return tuple(strides)
 
 
-def index_to_coords(index: int, shape):
-    assert isinstance(index, int), (index, type(index))
+def coords_to_index(coords, shape=None, strides=None) -> int:
+    """
+    Map user coords to field index. When ``strides`` is specified ``shape``
+    is ignored."""
+    if strides is None:
+        strides = shape_to_strides(shape)
+    return sum(c * s for c, s in zip(coords, strides))
 
-    result = [None] * len(shape)
-    i = len(shape) - 1
 
-    while i >= 0:
-        result[i] = index % shape[i]
-        index = index // shape[i]
-        i -= 1
+def index_to_coords(index, shape):
+    """
+    Map field index to user coords. When ``index`` is an ndarray the coords of
+    all the indexes are computed at once and returned as an integer ndarray
+    with an additional last axis of size ``len(shape)``."""
+    if isinstance(index, np.ndarray):
+        result = np.empty(index.shape + (len(shape),), dtype=np.int64)
+        for i in range(len(shape) - 1, -1, -1):
+            index, result[..., i] = np.divmod(index, shape[i])
+        return result
 
-    result = tuple(result)
+    result = [None] * len(shape)
+    for i in range(len(shape) - 1, -1, -1):
+        index, result[i] = divmod(index, shape[i])
 
-    assert len(result) == len(shape)
-    return result
+    return tuple(result)
 
 
 class CubeSelection(Selection):
@@ -93,6 +100,7 @@ class TensorCore(metaclass=ABCMeta):
     _user_coords = None
     _user_dims = None
     _user_shape = None
+    _user_strides = None
     _field_coords = None
     _field_dims = None
     _field_shape = None
@@ -112,7 +120,7 @@ class TensorCore(metaclass=ABCMeta):
     def field_shape(self):
         return self._field_shape
 
-    @property
+    @functools.cached_property
     def full_dims(self):
         d = dict(self._user_dims)
         d.update(self._field_dims)
@@ -126,7 +134,7 @@ class TensorCore(metaclass=ABCMeta):
     def field_dims(self):
         return self._field_dims
 
-    @property
+    @functools.cached_property
     def full_coords(self):
         d = dict(self._user_coords)
         d.update(self._field_coords)
@@ -219,35 +227,22 @@ class TensorCore(metaclass=ABCMeta):
         pass
 
     def _subset_coords(self, indexes):
-        import numpy as np
-
         # TODO: avoid copying values
         r = CubeCoords()
-        for i, k in enumerate(self.user_coords.keys()):
+        for i, (k, vals) in enumerate(self._user_coords.items()):
             if i < len(indexes):
                 idx = indexes[i]
-                # print(f"{k=} {idx=} {self.coords[k]}")
-                # print(self.coords[k][idx])
                 if isinstance(idx, (int, slice)):
-                    # print(f"{k=} {idx=} {self._user_coords[k]}")
-                    v = self._user_coords[k][idx]
+                    v = vals[idx]
                     if not isinstance(v, (list, tuple, np.ndarray)):
                         v = (v,)
                     r[k] = v
                 elif isinstance(idx, list):
-                    r[k] = tuple([self._user_coords[k][i] for i in idx])
+                    r[k] = tuple([vals[j] for j in idx])
             else:
-                r[k] = self._user_coords[k]
+                r[k] = vals
         return r
 
-    @staticmethod
-    def _index_to_coords_value(index, tensor):
-        coord_idx = index_to_coords(index, tensor._user_shape)
-        coords = []
-        for k, v in enumerate(tensor._user_coords.values()):
-            coords.append(v[coord_idx[k]])
-        return coords
-
     def _check(self):
         if self._full_shape != self._user_shape + self._field_shape:
             raise ValueError(
@@ -283,14 +278,16 @@ class FieldListTensor(TensorCore):
         field_coords,
         field_dims,
         flatten_values,
+        check=True,
     ):
         # print(f"FieldListTensor user_coords={user_coords}")
         # print(f"FieldListTensor field_coords={field_coords.keys()} {field_dims=}")
 
         self.source = source
         self._user_coords = user_coords
-        self._user_shape = self._coords_shape(user_coords)
         self._user_dims = {k: len(v) for k, v in user_coords.items()}
+        self._user_shape = tuple(self._user_dims.values())
+        self._user_strides = shape_to_strides(self._user_shape)
         self._field_coords = field_coords
         self._field_shape = self._dims_shape(field_dims)
         self._field_dims = field_dims
@@ -298,10 +295,11 @@ class FieldListTensor(TensorCore):
         self.flatten_values = flatten_values
 
         # consistency check
-        from earthkit.data.utils.xarray.check import CubeChecker
+        if check:
+            from earthkit.data.utils.xarray.check import CubeChecker
 
-        checker = CubeChecker(self)
-        checker.check(details=True)
+            checker = CubeChecker(self)
+            checker.check(details=True)
 
     @classmethod
     def from_tensor(cls, owner, source, user_coords):
@@ -311,6 +309,8 @@ class FieldListTensor(TensorCore):
             owner.field_coords,
             owner.field_dims,
             owner.flatten_values,
+            # a subset of a checked hypercube is a hypercube
+            check=False,
         )
 
     @classmethod
@@ -371,12 +371,15 @@ class FieldListTensor(TensorCore):
         self.source = None
         self._user_coords = None
         self._user_shape = None
+        self._user_strides = None
         self._user_dims = None
         self._field_coords = None
         self._field_shape = None
         self._field_dims = None
         self._full_shape = None
         self.flatten_values = None
+        self.__dict__.pop("full_dims", None)
+        self.__dict__.pop("full_coords", None)
 
     @flatten_arg
     def to_numpy(self, index=None, **kwargs):
@@ -408,28 +411,28 @@ class FieldListTensor(TensorCore):
         """Only allow subsetting for the user coordinates.
         Indices for the field coordinates are ignored.
         """
-        # Map the slices to a list of indexes per dimension
         assert len(indexes) >= len(self._user_shape)
+
+        # selecting everything does not change the tensor
+        if all(isinstance(s, slice) and s == slice(None, None, None) for s in indexes):
+            return self
+
+        # Map the slices to a list of indexes per dimension
         user_coords = []
         user_indexes = []
 
         for s, c in zip(indexes, self._user_shape):
-            lst = np.array(list(range(c)))[s].tolist()
-            if not isinstance(lst, list):
-                lst = [lst]
-            user_coords.append(lst)
+            user_coords.append(np.atleast_1d(np.arange(c)[s]))
             user_indexes.append(s)
 
         # print(f"{user_coords=} {user_indexes=}")
 
         assert len(user_coords) == len(self._user_coords)
 
-        dataset_indexes = []
-        user_shape = self._user_shape
-        for x in itertools.product(*user_coords):
-            i = coords_to_index(x, user_shape)
-            assert isinstance(i, int), i
-            dataset_indexes.append(i)
+        # the field indexes of the selected cells are computed by broadcasting
+        # the per-dimension indexes against each other (C-order)
+        dataset_indexes = sum(g * s for g, s in zip(np.ix_(*user_coords), self._user_strides))
+        dataset_indexes = np.ravel(dataset_indexes).tolist()
 
         coords = self._subset_coords(user_indexes)
         assert len(coords) == len(self._user_coords)
@@ -452,9 +455,8 @@ class FieldListTensor(TensorCore):
 
         for k in ["valid_datetime", "valid_time"]:
             if k in self.user_coords:
-                import datetime
-
-                return (k,), [datetime.datetime.fromisoformat(x) for x in self.user_coords[k]]
+                # NumPy parses the ISO 8601 strings itself
+                return (k,), np.array(self.user_coords[k], dtype=dtype)
 
         # print(f"{self.user_dims=}")
         for dims in dims_opt:
@@ -464,33 +466,16 @@ class FieldListTensor(TensorCore):
                 other_dims = [d for d in self.user_dims if d not in dims]
                 # print(f"{dims=} {other_dims=}")
                 if other_dims:
-                    import datetime
-
-                    import numpy as np
-
                     other_coords = {
                         k: next(iter(self.user_coords[k])) for k in other_dims if k in self.user_coords
                     }
 
-                    vals = np.array(
-                        [
-                            datetime.datetime.fromisoformat(x)
-                            for x in self.source.sel(**other_coords).metadata("valid_datetime")
-                        ],
-                        dtype=dtype,
-                    )
+                    vals = np.array(self.source.sel(**other_coords).metadata("valid_datetime"), dtype=dtype)
 
                     shape = tuple([self.user_dims[d] for d in dims])
                     return tuple(dims), vals.reshape(shape)
                 else:
-                    import datetime
-
-                    import numpy as np
-
-                    vals = np.array(
-                        [datetime.datetime.fromisoformat(x) for x in self.source.metadata("valid_datetime")],
-                        dtype=dtype,
-                    )
+                    vals = np.array(self.source.metadata("valid_datetime"), dtype=dtype)
 
                     shape = tuple([self.user_dims[d] for d in dims])
                     return tuple(dims), vals.reshape(shape)
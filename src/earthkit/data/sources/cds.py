@@ -8,8 +8,11 @@
 #
 
 import itertools
+import json
 import logging
+import os
 import sys
+import time
 from functools import cached_property
 
 try:
@@ -104,10 +107,11 @@ class CdsRetriever(FileSource):
     CdsRetriever
     """
 
-    def __init__(self, dataset, *args, prompt=True, **kwargs):
+    def __init__(self, dataset, *args, prompt=True, cache_ttl=None, **kwargs):
         super().__init__()
 
         self.prompt = prompt
+        self.cache_ttl = cache_ttl
 
         assert isinstance(dataset, str)
         if args and kwargs:
@@ -118,32 +122,65 @@ class CdsRetriever(FileSource):
         assert all(isinstance(request, dict) for request in args)
         self._args = args
 
-        self.client()  # Trigger password prompt before threading
+        self._client  # Trigger password prompt before threading
 
-        nthreads = min(self.config("number-of-download-threads"), len(self.requests))
+        # equivalent requests are only retrieved once
+        keys = [json.dumps(self._cache_key(r), sort_keys=True, default=str) for r in self.requests]
+        requests = dict(zip(keys, self.requests))
+
+        nthreads = min(self.config("number-of-download-threads"), len(requests))
+        max_nthreads = self.config("maximum-cds-download-threads")
+        if nthreads > max_nthreads:
+            LOG.info(
+                f"Using {max_nthreads} download threads instead of {nthreads}"
+                " as set by the maximum-cds-download-threads config option"
+            )
+            nthreads = max_nthreads
 
         if nthreads < 2:
-            self.path = [self._retrieve(dataset, r) for r in self.requests]
+            paths = [self._retrieve(dataset, r) for r in requests.values()]
         else:
             with SoftThreadPool(nthreads=nthreads) as pool:
-                futures = [pool.submit(self._retrieve, dataset, r) for r in self.requests]
+                futures = [pool.submit(self._retrieve, dataset, r) for r in requests.values()]
 
                 iterator = (f.result() for f in futures)
-                self.path = list(tqdm(iterator, leave=True, total=len(self.requests)))
+                paths = list(tqdm(iterator, leave=True, total=len(requests)))
+
+        paths = dict(zip(requests, paths))
+        self.path = [paths[k] for k in keys]
 
     def _retrieve(self, dataset, request):
-        def retrieve(target, args):
-            cds_result = self.client().retrieve(args[0], args[1])
+        def retrieve(target, _):
+            cds_result = self._client.retrieve(dataset, request)
             self.source_filename = cds_result.location.split("/")[-1]
             cds_result.download(target=target)
 
+        def expired(args, path, owner_data):
+            return time.time() - os.path.getmtime(path) > self.cache_ttl
+
         return_object = self.cache_file(
             retrieve,
-            (dataset, request),
+            (dataset, self._cache_key(request)),
             extension=EXTENSIONS.get(request.get("format"), ".cache"),
+            force=expired if self.cache_ttl is not None else None,
         )
         return return_object
 
+    @staticmethod
+    def _cache_key(request):
+        # Semantically equivalent requests must share the same cache entry, so
+        # the order of the values and single-element lists are normalised. The
+        # order of "area" and "grid" is meaningful and kept.
+        key = {}
+        for k, v in request.items():
+            if isinstance(v, (list, tuple)):
+                if len(v) == 1:
+                    v = v[0]
+                elif k not in ("area", "grid"):
+                    v = sorted(v, key=str)
+            key[k] = v
+        return key
+
     @staticmethod
     @normalize("date", "date-list(%Y-%m-%d)")
     @normalize("area", "bounding-box(list)")
@@ -162,15 +199,21 @@ class CdsRetriever(FileSource):
 
             if not isinstance(split_on, dict):
                 split_on = {k: 1 for k in ensure_iterable(split_on)}
+            base = {k: v for k, v in request.items() if k not in split_on}
             for values in itertools.product(
                 *[batched(ensure_iterable(request[k]), v) for k, v in split_on.items()]
             ):
-                subrequest = dict(zip(split_on, values))
-                requests.append({**request, **subrequest})
+                requests.append({**base, **dict(zip(split_on, values))})
         return requests
 
     def client(self):
         return client(self.prompt)
 
+    @cached_property
+    def _client(self):
+        # created once in __init__, before any download thread is started,
+        # and then shared by all the threads
+        return self.client()
+
 
 source = CdsRetriever
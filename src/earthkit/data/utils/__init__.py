@@ -151,6 +151,8 @@ def ensure_iterable(obj):
 
     if obj is None:
         return []
+    if isinstance(obj, (list, tuple)):
+        return obj
     if isinstance(obj, str) or not isinstance(obj, collections.abc.Iterable):
         return [obj]
     return obj
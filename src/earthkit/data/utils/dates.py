@@ -15,7 +15,6 @@ import numpy as np
 from earthkit.data.wrappers import get_wrapper
 
 ECC_SECONDS_FACTORS = {"s": 1, "m": 60, "h": 3600}
-NUM_STEP_PATTERN = re.compile(r"\d+")
 SUFFIX_STEP_PATTERN = re.compile(r"\d+[a-zA-Z]{1}")
 
 
@@ -81,6 +80,10 @@ def to_datetime_list(datetimes):  # noqa C901
                 to_datetime(datetimes[0]), to_datetime(datetimes[2]), int(datetimes[4])
             )
 
+        if datetimes and all(isinstance(x, np.datetime64) for x in datetimes):
+            # converted in one go by NumPy
+            return np.array(datetimes, dtype="datetime64[s]").tolist()
+
         return [to_datetime(x) for x in datetimes]
 
     datetimes = get_wrapper(datetimes)
@@ -154,10 +157,10 @@ def to_timedelta(td):
     # eccodes step format
     # TODO: make it work for all the ecCodes step formats
     if isinstance(td, str):
-        if re.fullmatch(NUM_STEP_PATTERN, td):
+        if td.isdecimal():
             return datetime.timedelta(hours=int(td))
 
-        if re.fullmatch(SUFFIX_STEP_PATTERN, td):
+        if SUFFIX_STEP_PATTERN.fullmatch(td):
             factor = ECC_SECONDS_FACTORS.get(td[-1], None)
             if factor is None:
                 raise ValueError(f"Unsupported ecCodes step units in step: {td}")
@@ -252,7 +255,7 @@ def step_to_grib(step):
 
 def datetime_to_grib(dt):
     dt = to_datetime(dt)
-    date = int(dt.strftime("%Y%m%d"))
+    date = dt.year * 10000 + dt.month * 100 + dt.day
     time = dt.hour * 100 + dt.minute
     return date, time
 
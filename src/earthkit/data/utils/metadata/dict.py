@@ -118,17 +118,23 @@ class UserGeography(Geography):
         self.metadata = metadata
         self._shape = shape
 
+    @cached_property
+    def _latitudes(self):
+        return np.asarray(self.metadata.get("latitudes"))
+
+    @cached_property
+    def _longitudes(self):
+        return np.asarray(self.metadata.get("longitudes"))
+
     def latitudes(self, dtype=None):
-        v = self.metadata.get("latitudes")
-        v = np.asarray(v)
+        v = self._latitudes
         if dtype is None:
             return v
         else:
             return v.astype(dtype)
 
     def longitudes(self, dtype=None):
-        v = self.metadata.get("longitudes")
-        v = np.asarray(v)
+        v = self._longitudes
         if dtype is None:
             return v
         else:
@@ -192,6 +198,7 @@ class DistinctLLGeography(UserGeography):
     def __init__(self, metadata):
         super().__init__(metadata)
 
+    @cached_property
     def _distinct_latitudes(self):
         v = self.metadata.get("latitudes", None)
         if v is None:
@@ -200,6 +207,7 @@ class DistinctLLGeography(UserGeography):
             raise ValueError("No latitudes found")
         return np.asarray(v)
 
+    @cached_property
     def _distinct_longitudes(self):
         v = self.metadata.get("longitudes", None)
         if v is None:
@@ -209,8 +217,8 @@ class DistinctLLGeography(UserGeography):
         return np.asarray(v)
 
     def latitudes(self, dtype=None):
-        lat = self._distinct_latitudes()
-        n_lon = len(self._distinct_longitudes())
+        lat = self._distinct_latitudes
+        n_lon = len(self._distinct_longitudes)
         v = np.repeat(lat[:, np.newaxis], n_lon, axis=1)
 
         if dtype is None:
@@ -219,8 +227,8 @@ class DistinctLLGeography(UserGeography):
             return v.astype(dtype)
 
     def longitudes(self, dtype=None):
-        lon = self._distinct_longitudes()
-        n_lat = len(self._distinct_latitudes())
+        lon = self._distinct_longitudes
+        n_lat = len(self._distinct_latitudes)
         v = np.repeat(lon[np.newaxis, :], n_lat, axis=0)
 
         if dtype is None:
@@ -229,8 +237,8 @@ class DistinctLLGeography(UserGeography):
             return v.astype(dtype)
 
     def shape(self):
-        Nj = len(self._distinct_latitudes())
-        Ni = len(self._distinct_longitudes())
+        Nj = len(self._distinct_latitudes)
+        Ni = len(self._distinct_longitudes)
         return (Nj, Ni)
 
 
@@ -239,7 +247,7 @@ class RegularDistinctLLGeography(DistinctLLGeography):
     def dx(self):
         x = self.metadata.get("DxInDegrees", None)
         if x is None:
-            lon = self._distinct_longitudes()
+            lon = self._distinct_longitudes
             x = lon[1] - lon[0]
         x = abs(round(x * 1_000_000) / 1_000_000)
         return x
@@ -247,7 +255,7 @@ class RegularDistinctLLGeography(DistinctLLGeography):
     def dy(self):
         y = self.metadata.get("DyInDegrees", None)
         if y is None:
-            lat = self._distinct_latitudes()
+            lat = self._distinct_latitudes
             y = lat[0] - lat[1]
         y = abs(round(y * 1_000_000) / 1_000_000)
         return y
@@ -272,6 +280,9 @@ class UserMetadata(Metadata):
         ("param", "shortName"),
     ]
 
+    # maps each key to its group in ALIASES
+    ALIAS_GROUPS = {k: group for group in ALIASES for k in group}
+
     ACCESSORS = {
         "base_datetime": "base_datetime",
         "valid_datetime": "valid_datetime",
@@ -304,32 +315,28 @@ class UserMetadata(Metadata):
 
     @MetadataAccessor(ACCESSORS, ALIASES)
     def get(self, key, default=None, *, astype=None, raise_on_missing=False):
-        def _key_name(key):
-            if key in self._data:
-                return key
+        if key in self._data:
+            v = self._data[key]
+        else:
+            for k in self.ALIAS_GROUPS.get(key, ()):
+                if k in self._data:
+                    v = self._data[k]
+                    break
             else:
-                for group in self.ALIASES:
-                    if key in group:
-                        for k in group:
-                            if k in self._data:
-                                return k
-
-        key_n = _key_name(key)
-        if key_n is None:
-            if raise_on_missing:
-                raise KeyError(f"Key={key} not found")
-            return default
-
-        v = self._data[key_n]
+                if raise_on_missing:
+                    raise KeyError(f"Key={key} not found")
+                return default
+
         if astype is None:
             return v
         else:
             return astype(v)
 
     def datetime(self):
+        base_dt = self.base_datetime()
         return {
-            "base_time": self.base_datetime(),
-            "valid_time": self.valid_datetime(),
+            "base_time": base_dt,
+            "valid_time": self._valid_datetime(base_dt),
         }
 
     def base_datetime(self):
@@ -347,12 +354,16 @@ class UserMetadata(Metadata):
             return self.valid_datetime() - v
 
     def valid_datetime(self):
+        if "valid_datetime" in self._data:
+            return self._valid_datetime(None)
+        return self._valid_datetime(self.base_datetime())
+
+    def _valid_datetime(self, base_dt):
         if "valid_datetime" in self._data:
             v = self._data["valid_datetime"]
             v = to_datetime(v)
             return v
 
-        base_dt = self.base_datetime()
         if base_dt is not None:
             td = self.step_timedelta()
             if td is not None:
@@ -10,6 +10,10 @@
 import logging
 import math
 
+import numpy as np
+
+from earthkit.data.indexing.tensor import index_to_coords
+
 from .diff import DictDiff
 from .diff import ListDiff
 
@@ -22,8 +26,8 @@ def list_to_str(vals, n=10):
         if len(vals) <= n:
             return size + str(vals)
         else:
-            lst = size + "[" + ", ".join(str(vals[: n - 1])) + "..., " + str(vals[-1]) + "]"
-            return lst
+            head = ", ".join(str(vals[i]) for i in range(n - 1))
+            return size + "[" + head + ", ..., " + str(vals[-1]) + "]"
     except Exception:
         return vals
 
@@ -48,8 +52,11 @@ class CubeChecker:
         self.tensor = tensor
 
     def first_diff(self, coord_keys):
+        coords = list(self.tensor._user_coords.values())
+        # the expected coords indexes of all the fields
+        coords_idx = index_to_coords(np.arange(len(self.tensor.source)), self.tensor._user_shape)
         for i, f in enumerate(self.tensor.source):
-            t_coords = self.tensor._index_to_coords_value(i, self.tensor)
+            t_coords = [v[j] for v, j in zip(coords, coords_idx[i])]
             f_coords = f.metadata(coord_keys)
             diff = ListDiff.diff(t_coords, f_coords)
             if not diff.same:
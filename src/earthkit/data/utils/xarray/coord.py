@@ -42,20 +42,11 @@ class Coord:
                 )
 
     @staticmethod
-    def make(name, *args, **kwargs):
-        if name in DATETIME_KEYS:
-            return DateTimeCoord(name, *args, **kwargs)
-        elif name in DATE_KEYS:
-            return DateCoord(name, *args, **kwargs)
-        elif name in TIME_KEYS:
-            return TimeCoord(name, *args, **kwargs)
-        elif name in MONTH_KEYS:
-            return MonthCoord(name, *args, **kwargs)
-        elif name in STEP_KEYS:
-            return StepCoord(name, *args, **kwargs)
-        elif name in LEVEL_KEYS:
-            return LevelCoord(name, *args, **kwargs)
-        return Coord(name, *args, **kwargs)
+    def make(name, *args, step_keys=None, **kwargs):
+        c = COORD_TYPES.get(name)
+        if c is None:
+            c = StepCoord if step_keys and name in step_keys else Coord
+        return c(name, *args, **kwargs)
 
     def to_xr_var(self, profile):
         import xarray
@@ -141,6 +132,18 @@ class StepCoord(Coord):
     def convert(self, profile):
         from earthkit.data.utils.dates import to_timedelta
 
+        # integer steps are in hours and can be converted in one go
+        if len(self.vals) > 0 and all(type(x) is int for x in self.vals):
+            if profile.decode_timedelta:
+                import numpy as np
+
+                # same resolution as xarray uses for datetime.timedelta values
+                vals = np.asarray(self.vals, dtype="int64") * np.timedelta64(1, "h")
+                return vals.astype("timedelta64[us]")
+            else:
+                self.resolution = datetime.timedelta(hours=1)
+                return list(self.vals)
+
         vals = [to_timedelta(x) for x in self.vals]
 
         if profile.decode_timedelta:
@@ -175,8 +178,8 @@ class LevelCoord(Coord):
     def __init__(self, name, vals, dims=None, ds=None, **kwargs):
         self.level_type = {}
         if ds is not None:
-            for k in ["levtype", "typeOfLevel"]:
-                v = ds[0].metadata(k, default=None)
+            keys = ["levtype", "typeOfLevel"]
+            for k, v in zip(keys, ds[0].metadata(keys, default=None)):
                 if v is not None:
                     self.level_type[k] = v
 
@@ -192,3 +195,20 @@ class LevelCoord(Coord):
                 return conf.get(level_type, {})
         return {}
         # raise ValueError(f"Cannot determine level type for coordinate {name}")
+
+
+# when a key belongs to more than one group the first group takes precedence
+COORD_TYPES = {
+    k: c
+    for keys, c in reversed(
+        (
+            (DATETIME_KEYS, DateTimeCoord),
+            (DATE_KEYS, DateCoord),
+            (TIME_KEYS, TimeCoord),
+            (MONTH_KEYS, MonthCoord),
+            (STEP_KEYS, StepCoord),
+            (LEVEL_KEYS, LevelCoord),
+        )
+    )
+    for k in keys
+}
@@ -9,15 +9,27 @@
 
 import logging
 import math
+import operator
+
+import numpy as np
 
 LOG = logging.getLogger(__name__)
 
 
 class DictDiffInfo:
-    def __init__(self, same, diff_dict={}, diff_text=str()):
+    __slots__ = ("same", "diff_dict", "_diff_text")
+
+    def __init__(self, same, diff_dict=None, diff_text=None):
         self.same = same
-        self.diff_dict = dict(**diff_dict)
-        self.diff_text = diff_text
+        self.diff_dict = {} if diff_dict is None else diff_dict
+        self._diff_text = diff_text
+
+    @property
+    def diff_text(self):
+        # only formatted when needed
+        if self._diff_text is None:
+            self._diff_text = ", ".join([f"{k}: {v[0]} != {v[1]}" for k, v in self.diff_dict.items()])
+        return self._diff_text
 
 
 class DictDiff:
@@ -29,9 +41,13 @@ class DictDiff:
         if not isinstance(vals2, dict):
             raise ValueError(f"Unsupported type for vals2: {type(vals2)}. Expecting dict")
 
-        diff_dict = {}
+        if vals1 is vals2:
+            return DictDiffInfo(True)
+
         if len(vals1) != len(vals2):
-            return ListDiffInfo(False, ListDiff.VALUE_DIFF, f"Length mismatch: {len(vals1)} != {len(vals2)}")
+            return DictDiffInfo(False, diff_text=f"Length mismatch: {len(vals1)} != {len(vals2)}")
+
+        diff_dict = {}
 
         for k, v1 in vals1.items():
             if k not in vals2:
@@ -43,14 +59,15 @@ class DictDiff:
                     diff_dict[k] = (v2, v1)
 
         if diff_dict:
-            diff_text = ", ".join([f"{k}: {v[0]} != {v[1]}" for k, v in diff_dict.items()])
-            return DictDiffInfo(False, diff_dict=diff_dict, diff_text=diff_text)
+            return DictDiffInfo(False, diff_dict=diff_dict)
         else:
             return DictDiffInfo(True)
 
 
 class ListDiffInfo:
-    def __init__(self, same, diff_type=None, diff_text=str(), diff_index=-1):
+    __slots__ = ("same", "type", "diff_text", "diff_index")
+
+    def __init__(self, same, diff_type=None, diff_text="", diff_index=-1):
         self.same = same
         self.type = diff_type
         self.diff_text = diff_text
@@ -66,7 +83,7 @@ class ListDiff:
         if isinstance(v1, int) and isinstance(v2, int):
             return v1 == v2, ListDiff.VALUE_DIFF
         elif isinstance(v1, float) and isinstance(v2, float):
-            return math.isclose(v1, v2, rel_tol=1e-9), ListDiff.VALUE_DIFF
+            return v1 == v2 or math.isclose(v1, v2, rel_tol=1e-9), ListDiff.VALUE_DIFF
         elif isinstance(v1, str) and isinstance(v2, str):
             return v1 == v2, ListDiff.VALUE_DIFF
         elif type(v1) is not type(v2):
@@ -75,7 +92,36 @@ class ListDiff:
             raise ValueError(f"Unsupported type: {type(v1)}")
 
     @staticmethod
-    def diff(vals1, vals2, name=str()):
+    def _same_type(vals):
+        # the type of the values when all of them have the same type
+        t = type(vals[0])
+        if all(type(v) is t for v in vals):
+            return t
+
+    @staticmethod
+    def _fast_diff(vals1, vals2):
+        # Return -1 when the lists are the same and the index of the first
+        # difference when it can be located without comparing the values one
+        # by one. Otherwise return None.
+        t = ListDiff._same_type(vals1)
+        if t not in (int, float, str) or ListDiff._same_type(vals2) is not t:
+            return None
+
+        # exact equality is checked in C without calling _compare per element
+        if all(map(operator.eq, vals1, vals2)):
+            return -1
+
+        if t is float:
+            a = np.asarray(vals1)
+            b = np.asarray(vals2)
+            # same as math.isclose(v1, v2, rel_tol=1e-9), infinities are only close to themselves
+            finite = np.isfinite(a) & np.isfinite(b)
+            with np.errstate(invalid="ignore"):
+                close = (a == b) | (finite & (np.abs(a - b) <= 1e-9 * np.maximum(np.abs(a), np.abs(b))))
+            return int(np.argmin(close)) if not close.all() else -1
+
+    @staticmethod
+    def diff(vals1, vals2, name=""):
         if not isinstance(vals1, (list, tuple)):
             raise ValueError(f"Unsupported type for vals1: {type(vals1)}. Expecting list/tuple")
 
@@ -85,6 +131,15 @@ class ListDiff:
         if len(vals1) != len(vals2):
             return ListDiffInfo(False, ListDiff.VALUE_DIFF, f"Length mismatch: {len(vals1)} != {len(vals2)}")
 
+        # homogeneous int, float and str lists are compared in one go
+        if vals1:
+            i = ListDiff._fast_diff(vals1, vals2)
+            if i == -1:
+                return ListDiffInfo(True)
+            elif i is not None:
+                diff = f"Value mismatch at {name}[{i}]: {vals1[i]} != {vals2[i]}"
+                return ListDiffInfo(False, ListDiff.VALUE_DIFF, diff, i)
+
         for i, (v1, v2) in enumerate(zip(vals1, vals2)):
             same, diff = ListDiff._compare(v1, v2)
             if not same:
@@ -56,17 +56,24 @@ BASE_DATETIME_KEYS = [
 ]
 DATETIME_KEYS = BASE_DATETIME_KEYS + VALID_DATETIME_KEYS
 
-KEYS = (
-    ENS_KEYS
-    + LEVEL_KEYS
-    + LEVEL_TYPE_KEYS
-    + DATE_KEYS
-    + TIME_KEYS
-    + STEP_KEYS
-    + VALID_DATETIME_KEYS
-    + BASE_DATETIME_KEYS
+# groups of keys with the same meaning
+ALIAS_GROUPS = (
+    ENS_KEYS,
+    LEVEL_KEYS,
+    LEVEL_TYPE_KEYS,
+    DATE_KEYS,
+    TIME_KEYS,
+    STEP_KEYS,
+    VALID_DATETIME_KEYS,
+    BASE_DATETIME_KEYS,
 )
 
+# the keys of all the groups containing a given key
+ALIASES = {}
+for group in ALIAS_GROUPS:
+    for k in group:
+        ALIASES.setdefault(k, []).extend(group)
+
 
 def get_keys(keys, drop=None):
     r = list(keys)
@@ -77,11 +84,7 @@ def get_keys(keys, drop=None):
 
 
 def find_alias(key, drop=None):
-    keys = KEYS
-    r = []
-    for k in keys:
-        if key in k:
-            r.extend(k)
+    r = list(ALIASES.get(key, []))
 
     if drop:
         drop = ensure_iterable(drop)
@@ -90,15 +93,15 @@ def find_alias(key, drop=None):
 
 
 def make_dim(owner, name, *args, **kwargs):
-    if name in PREDEFINED_DIMS:
-        return PREDEFINED_DIMS[name](owner, *args, key=name, **kwargs)
+    dim = PREDEFINED_DIMS.get(name)
+    if dim is not None:
+        return dim(owner, *args, key=name, **kwargs)
 
-    ck = CompoundKey.make(name)
+    ck = COMPOUND_KEYS.get(name)
     if ck is not None:
-        d = CompoundKeyDim(owner, ck)
-    else:
-        d = OtherDim(owner, name, *args, **kwargs)
-    return d
+        return CompoundKeyDim(owner, ck())
+
+    return OtherDim(owner, name, *args, **kwargs)
 
 
 class Dim:
@@ -156,24 +159,24 @@ class Dim:
         if drop is not None:
             self.drop = drop
 
+        # the name and key cannot be in the alias and drop lists
+        own = (self.name, self.key)
+
         def _drop(v):
-            return [k for k in v if k not in [self.name, self.key]]
+            return [k for k in v if k not in own]
 
         self.alias = _drop(ensure_iterable(self.alias))
         self.drop = _drop(ensure_iterable(self.drop))
 
-        assert self.name not in self.alias
-        assert self.name not in self.drop
-        assert self.key not in self.alias
-        assert self.key not in self.drop
+        # the keys identifying this dimension
+        self._members = frozenset([self.name, self.key, *self.alias])
 
         self.coords = {}
 
     def __contains__(self, key):
-        return key in [self.name, self.key] or key in self.alias
+        return key in self._members
 
     def check(self):
-        # print(f"CHECK {self.name} {self.key} {self.active}")
         if self.active:
             self.active = self.condition()
             if self.active:
@@ -183,9 +186,6 @@ class Dim:
         return True
 
     def update(self, ds):
-        # if self.key in ds.indices():
-        #     print(f"-> {self.name} key={self.key} active={self.active} ds={ds.index(self.key)}")
-
         if not self.active:
             return
 
@@ -195,8 +195,6 @@ class Dim:
                 (f"Variable key {self.profile.variable_key} cannot be in " f"dimension={self.name}")
             )
 
-        # print(f"key={self.key} index={ds.index(self.key)}")
-
         vals = ds.index(self.key)
 
         if len(vals) == 0:
@@ -217,7 +215,9 @@ class Dim:
         if key not in self.coords:
             from .coord import Coord
 
-            self.coords[key] = Coord.make(key, values, ds=source, component=component)
+            self.coords[key] = Coord.make(
+                key, values, ds=source, component=component, step_keys=self.owner.step_keys
+            )
         return key, self.coords[key]
 
     def remapping_keys(self):
@@ -410,22 +410,11 @@ class ForecastTimeDimMode(DimMode):
         step = owner.dim_roles["step"]
         step_dim = make_dim(owner, step, active=active)
 
-        self.register_ref_time_key(ref_time_dim.name)
-        self.register_step_key(step_dim.name)
+        if step_dim.name not in STEP_KEYS:
+            owner.step_keys.add(step_dim.name)
 
         return {d.name: d for d in [ref_time_dim, step_dim]}
 
-    def register_ref_time_key(self, name):
-        global BASE_DATETIME_KEYS
-        global VALID_DATETIME_KEYS
-        if name not in BASE_DATETIME_KEYS:
-            BASE_DATETIME_KEYS.append(name)
-
-    def register_step_key(self, name):
-        global STEP_KEYS
-        if name not in STEP_KEYS:
-            STEP_KEYS.append(name)
-
 
 class ValidTimeDimMode(DimMode):
     name = "valid_time"
@@ -500,9 +489,8 @@ class TimeDimBuilder(DimBuilder):
 
         mode = mode()
         self.used = mode.build(profile, owner)
-        self.ignored = {
-            k: v().build(profile, owner, active=False) for k, v in TIME_DIM_MODES.items() if v != mode
-        }
+        # only the names of the other modes are used, there is no need to build their dims
+        self.ignored = {k: v for k, v in TIME_DIM_MODES.items() if v is not type(mode)}
 
 
 class LevelDimBuilder(DimBuilder):
@@ -515,9 +503,8 @@ class LevelDimBuilder(DimBuilder):
 
         mode = mode()
         self.used = mode.build(profile, owner)
-        self.ignored = {
-            k: v().build(profile, owner, active=False) for k, v in LEVEL_DIM_MODES.items() if v != mode
-        }
+        # only the names of the other modes are used, there is no need to build their dims
+        self.ignored = {k: v for k, v in LEVEL_DIM_MODES.items() if v is not type(mode)}
 
 
 DIM_BUILDERS = {v.name: v for v in [NumberDimBuilder, TimeDimBuilder, LevelDimBuilder]}
@@ -554,6 +541,9 @@ class Dims:
         self.level_dim_mode = level_dim_mode
         self.squeeze = squeeze
 
+        # step keys defined by the dim_roles in addition to STEP_KEYS
+        self.step_keys = set()
+
         self.var_key_dim = None
 
         if self.fixed_dims:
@@ -568,7 +558,6 @@ class Dims:
             assert "__var_key_dim__" not in dims
             self.dims = {"__var_key_dim__": self.var_key_dim, **dims}
 
-            # print(f"INIT dims={self.dims}")
             # check dims consistency. The ones that can be used
             # marked as active
             for k, d in self.dims.items():
@@ -576,7 +565,6 @@ class Dims:
 
             var_keys = ["__var_key_dim__", self.profile.variable_key]
 
-            # print(f" -> dims={self.dims}")
             # check for any dimensions related to variable keys. These have to
             # be removed from the list of active dims.
             var_dims = self.deactivate(var_keys, others=True, collect=True)
@@ -647,28 +635,25 @@ class Dims:
     def _init_dims(self):
         assert not self.fixed_dims
 
+        extra_dims = set(self.extra_dims)
+        ensure_dims = set(self.ensure_dims)
+        drop_dims = set(self.drop_dims)
+
         for k in self.drop_dims:
-            if k in self.extra_dims:
+            if k in extra_dims:
                 raise ValueError(f"Key {k} cannot be in drop_dims and extra_dims")
-            if k in self.ensure_dims:
+            if k in ensure_dims:
                 raise ValueError(f"Key {k} cannot be in drop_dims and ensure_dims")
 
         for k in self.split_dims:
-            if k not in self.drop_dims and k not in self.extra_dims and k not in self.ensure_dims:
+            if k not in drop_dims and k not in extra_dims and k not in ensure_dims:
                 self.drop_dims.append(k)
-
-        def _remove_duplicates(keys):
-            r = []
-            for k in keys:
-                if k not in r:
-                    r.append(k)
-            return r
+                drop_dims.add(k)
 
         var_keys = [self.profile.variable_key]
 
-        # non-core dims
-        keys = self.extra_dims + self.ensure_dims
-        keys = _remove_duplicates(keys)
+        # non-core dims, without duplicates
+        keys = list(dict.fromkeys(self.extra_dims + self.ensure_dims))
 
         remapping_dims = self._init_remapping_dims(keys)
         dims = dict(**remapping_dims)
@@ -682,8 +667,7 @@ class Dims:
             if k not in dims:
                 dims[k] = make_dim(self, name=k)
 
-        dims = {k: v for k, v in dims.items() if k not in self.drop_dims}
-        # print(f"dims", dims)
+        dims = {k: v for k, v in dims.items() if k not in drop_dims}
 
         # initial check for variable-related dimensions
         invalid_var_keys = []
@@ -696,43 +680,30 @@ class Dims:
 
         # add predefined dimensions
         core_dims = {}
-        ignored = {}
+        ignored = set()
         self.core_dim_order = []
-        for k, v in DIM_BUILDERS.items():
-            builder = v(self.profile, self)
-            used, ignored = builder.dims()
+        for builder_cls in DIM_BUILDERS.values():
+            used, builder_ignored = builder_cls(self.profile, self).dims()
             for k, v in used.items():
                 core_dims[k] = v
                 self.core_dim_order.append(k)
+            # only the names ignored by the last builder are filtered out
+            ignored = set(builder_ignored)
 
-            ignored.update(ignored)
-
-        for k in list(ignored.keys()):
-            if k in remapping_dims:
-                ignored.pop(k)
-
-        # print(f"ignored", ignored)
+        ignored.difference_update(remapping_dims)
 
         # construct initial dims, ensure core dims are in the right order
-        all_dims = {}
-        for k in dims:
-            if k in remapping_dims or (k not in core_dims and k not in ignored):
-                if k in self.ensure_dims or k not in self.drop_dims:
-                    all_dims[k] = dims[k]
-
-            # # if k not in self.drop_dims and k not in self.split_dims:
-            # if k in self.ensure_dims or k not in self.drop_dims and
-
-            # if k not in self.drop_dims and (k not in self.split_dims or k in self.ensure_dims):
-            #     if k in remapping_dims or (k not in core_dims and k not in ignored):
-            #         all_dims[k] = dims[k]
+        all_dims = {
+            k: d
+            for k, d in dims.items()
+            if (k in remapping_dims or (k not in core_dims and k not in ignored))
+            and (k in ensure_dims or k not in drop_dims)
+        }
 
-        for k in core_dims:
-            if k not in all_dims and k not in self.drop_dims and k not in remapping_dims:
-                # assert k not in all_dims
-                all_dims[k] = core_dims[k]
+        for k, d in core_dims.items():
+            if k not in all_dims and k not in drop_dims and k not in remapping_dims:
+                all_dims[k] = d
 
-        # print(f"all_dims", all_dims)
         return all_dims
 
     def var_dim_found_error_message(self, keys):
@@ -747,10 +718,10 @@ class Dims:
 
     def deactivate(self, keys, ignore_dim=None, others=False, collect=False):
         names = []
+        keys = frozenset(keys)
         for d in self.dims.values():
             if d.active and d != ignore_dim:
-                if any(key in d for key in keys):
-                    # print(f"deactivate d={d.name} keys={keys}")
+                if not keys.isdisjoint(d._members):
                     d.active = False
                     if others:
                         d.deactivate_drop_list()
@@ -780,16 +751,11 @@ class Dims:
 
     def as_coord(self, tensor):
         r = {}
-
-        def _get(k):
-            for d in self.dims.values():
-                if k == d.key:
-                    return d
-
+        key_to_dim = {d.key: d for d in self.dims.values()}
         for k, v in tensor.user_coords.items():
-            for d in self.dims.values():
-                d = _get(k)
-                name, coord = d.as_coord(k, v, tensor.source)
+            d = key_to_dim.get(k)
+            if d is not None:
+                name, coord = d.as_coord(k, v, None, tensor.source)
                 r[name] = coord
 
         return r
@@ -807,24 +773,23 @@ class Dims:
         return r
 
 
+# built once at import time. Dims without a name are registered under all their
+# aliases, when an alias is shared the first dim in the list takes precedence.
 PREDEFINED_DIMS = {}
-for i, d in enumerate(
-    [
-        NumberDim,
-        ForecastRefTimeDim,
-        DateDim,
-        TimeDim,
-        StepDim,
-        ValidTimeDim,
-        LevelDim,
-        LevelPerTypeDim,
-        LevelAndTypeDim,
-    ]
-):
+for d in [
+    NumberDim,
+    ForecastRefTimeDim,
+    DateDim,
+    TimeDim,
+    StepDim,
+    ValidTimeDim,
+    LevelDim,
+    LevelPerTypeDim,
+    LevelAndTypeDim,
+]:
     if d.name:
         PREDEFINED_DIMS[d.name] = d
     else:
         assert d.alias
         for k in d.alias:
-            if k not in PREDEFINED_DIMS:
-                PREDEFINED_DIMS[k] = d
+            PREDEFINED_DIMS.setdefault(k, d)
@@ -9,6 +9,7 @@
 # nor does it submit to any jurisdiction.
 #
 
+import io
 import os
 import sys
 
@@ -26,9 +27,13 @@ from array_fl_fixtures import check_array_fl  # noqa: E402
 from array_fl_fixtures import check_array_fl_from_to_fieldlist  # noqa: E402
 
 
-def test_array_fl_grib_single_field():
-    ds = from_source("file", earthkit_examples_file("test.grib"))
+@pytest.fixture(scope="module")
+def ds():
+    # the tests do not modify the input, so the file is opened once for the module
+    return from_source("file", earthkit_examples_file("test.grib"))
 
+
+def test_array_fl_grib_single_field(ds):
     assert ds[0].metadata("shortName") == "2t"
 
     lat, lon, v = ds[0].data(flatten=True)
@@ -44,8 +49,9 @@ def test_array_fl_grib_single_field():
         assert r[0].shape == ds[0].shape
         assert r[0].metadata("shortName") == "msl"
         _lat, _lon, _v = r[0].data(flatten=True)
-        assert np.allclose(_lat, lat)
-        assert np.allclose(_lon, lon)
+        # the geography is not packed so it must be identical
+        assert np.array_equal(_lat, lat)
+        assert np.array_equal(_lon, lon)
         assert np.allclose(_v, v1)
 
     _check_field(r)
@@ -58,9 +64,7 @@ def test_array_fl_grib_single_field():
     _check_field(r_tmp)
 
 
-def test_array_fl_grib_multi_field():
-    ds = from_source("file", earthkit_examples_file("test.grib"))
-
+def test_array_fl_grib_multi_field(ds):
     assert ds[0].metadata("shortName") == "2t"
 
     v = ds.values
@@ -76,11 +80,12 @@ def test_array_fl_grib_multi_field():
         assert f.metadata("shortName") == "2d", f"shortName {i}"
         assert f.metadata("name") == "2 metre dewpoint temperature", f"name {i}"
 
-    # save to disk
-    tmp = temp_file()
-    r.save(tmp.path)
-    assert os.path.exists(tmp.path)
-    r_tmp = from_source("file", tmp.path)
+    # round trip through an in-memory GRIB stream, the on-disk path is
+    # covered by test_array_fl_grib_single_field
+    buf = io.BytesIO()
+    r.write(buf)
+    buf.seek(0)
+    r_tmp = from_source("stream", buf, read_all=True)
     assert len(r_tmp) == 2
     assert np.allclose(v1, r_tmp.values)
     for i, f in enumerate(r_tmp):
@@ -89,8 +94,7 @@ def test_array_fl_grib_multi_field():
         assert f.metadata("name") == "2 metre dewpoint temperature", f"name {i}"
 
 
-def test_array_fl_grib_from_list_of_arrays():
-    ds = from_source("file", earthkit_examples_file("test.grib"))
+def test_array_fl_grib_from_list_of_arrays(ds):
     md_full = ds.metadata("param")
     assert len(ds) == 2
 
@@ -101,8 +105,7 @@ def test_array_fl_grib_from_list_of_arrays():
     check_array_fl(r, [ds], md_full)
 
 
-def test_array_fl_grib_from_list_of_arrays_bad():
-    ds = from_source("file", earthkit_examples_file("test.grib"))
+def test_array_fl_grib_from_list_of_arrays_bad(ds):
 
     v = ds[0].values
     md = [f.metadata().override(generatingProcessIdentifier=150) for f in ds]
@@ -124,8 +127,7 @@ def test_array_fl_grib_from_list_of_arrays_bad():
         {"flatten": True, "dtype": np.float32},
     ],
 )
-def test_array_fl_grib_from_to_fieldlist(kwargs):
-    ds = from_source("file", earthkit_examples_file("test.grib"))
+def test_array_fl_grib_from_to_fieldlist(kwargs, ds):
     md_full = ds.metadata("param")
     assert len(ds) == 2
 
@@ -133,8 +135,7 @@ def test_array_fl_grib_from_to_fieldlist(kwargs):
     check_array_fl_from_to_fieldlist(r, [ds], md_full, **kwargs)
 
 
-def test_array_fl_grib_from_to_fieldlist_repeat():
-    ds = from_source("file", earthkit_examples_file("test.grib"))
+def test_array_fl_grib_from_to_fieldlist_repeat(ds):
     md_full = ds.metadata("param")
     assert len(ds) == 2
 
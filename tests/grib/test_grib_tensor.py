@@ -109,6 +109,34 @@ def test_grib_tensor_core():
             cnt += 1
 
 
+def test_grib_tensor_index_to_coords():
+    from earthkit.data.indexing.tensor import coords_to_index
+    from earthkit.data.indexing.tensor import index_to_coords
+
+    shape = (2, 3, 4)
+    ref = np.array(np.unravel_index(np.arange(24), shape)).T
+
+    for i, c in enumerate(ref):
+        assert index_to_coords(i, shape) == tuple(c)
+        assert index_to_coords(np.int64(i), shape) == tuple(c)
+        assert coords_to_index(tuple(c), shape) == i
+
+    assert np.array_equal(index_to_coords(np.arange(24), shape), ref)
+    assert np.array_equal(index_to_coords(np.arange(24).reshape(4, 6), shape), ref.reshape(4, 6, 3))
+
+
+def test_grib_tensor_full_subset():
+    ds = from_source("file", earthkit_examples_file("tuv_pl.grib"))
+    c = ds.to_tensor("param", "level")
+
+    assert c[:, :] is c
+    assert c.isel() is c
+
+    r = c[:, 1:]
+    assert r is not c
+    assert r.user_shape == (3, 5)
+
+
 # def test_grib_cube_non_hypercube():
 #     ds = from_source("file", earthkit_examples_file("tuv_pl.grib"))
 #     ds += from_source("file", earthkit_test_data_file("ml_data.grib"))[:2]
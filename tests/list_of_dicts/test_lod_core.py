@@ -96,6 +96,17 @@ def test_lod_ll(lod_distinct_ll, mode):
     }
 
 
+def test_lod_coords_converted_once(lod_distinct_ll_list_values):
+    ds = build_lod_fieldlist(lod_distinct_ll_list_values, "list-of-dicts")
+
+    # the metadata keeps the original values
+    assert ds[0].metadata("latitudes") is lod_distinct_ll_list_values[0]["latitudes"]
+
+    g = ds[0].metadata().geography
+    assert isinstance(g._distinct_latitudes, np.ndarray)
+    assert g._distinct_latitudes is g._distinct_latitudes
+
+
 if __name__ == "__main__":
     from earthkit.data.testing import main
 
@@ -16,6 +16,7 @@ import pytest
 from earthkit.data import from_source
 from earthkit.data.core.temporary import temp_directory
 from earthkit.data.testing import NO_CDS
+from earthkit.data.testing import modules_installed
 from earthkit.data.testing import preserve_cwd
 
 CDS_TIMEOUT = pytest.CDS_TIMEOUT
@@ -449,6 +450,18 @@ def test_cds_netcdf_to_pandas_xarray():
     # assert data_cds.to_pandas().equals(data_file.to_pandas())
 
 
+@pytest.mark.skipif(not modules_installed("cdsapi"), reason="cdsapi not installed")
+def test_cds_cache_key():
+    from earthkit.data.sources.cds import CdsRetriever
+
+    r1 = dict(variable=["msl", "2t"], area=[50, -50, 20, 50], date=["2012-12-12"], time="12:00")
+    r2 = dict(time=["12:00"], date="2012-12-12", area=[50, -50, 20, 50], variable=["2t", "msl"])
+    assert CdsRetriever._cache_key(r1) == CdsRetriever._cache_key(r2)
+
+    r3 = dict(r1, area=[20, 50, 50, -50])
+    assert CdsRetriever._cache_key(r1) != CdsRetriever._cache_key(r3)
+
+
 if __name__ == "__main__":
     from earthkit.data.testing import main
 
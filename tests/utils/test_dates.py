@@ -147,6 +147,11 @@ def test_mars_like_date_list(args, expected_value, error):
         ("20020502", [datetime.datetime(2002, 5, 2)], None),
         (datetime.datetime(2002, 5, 2), [datetime.datetime(2002, 5, 2)], None),
         (np.datetime64("2002-05-02"), [datetime.datetime(2002, 5, 2, tzinfo=tzinfo)], None),
+        (
+            [np.datetime64("2002-05-02"), np.datetime64("2002-05-02T06:00:00.000000000")],
+            [datetime.datetime(2002, 5, 2, tzinfo=tzinfo), datetime.datetime(2002, 5, 2, 6, tzinfo=tzinfo)],
+            None,
+        ),
     ],
 )
 def test_to_datetime_list(d, expected_value, error):
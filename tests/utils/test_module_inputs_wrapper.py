@@ -9,6 +9,7 @@
 
 import numpy as np
 import pandas as pd
+import pytest
 import xarray as xr
 
 from earthkit.data import from_object
@@ -56,31 +57,34 @@ WRAPPED_DUMMY_MODULE = module_inputs_wrapper.transform_module_inputs(
 )
 
 
-def test_transform_function_inputs_reader_to_xarray():
+@pytest.fixture(scope="module")
+def ek_grib_reader():
+    # the tests only read from it, so the file is opened once for the module
+    return from_source("file", earthkit_test_data_file("test_single.grib"))
+
+
+def test_transform_function_inputs_reader_to_xarray(ek_grib_reader):
     # Check EK GribReader object
-    EK_GRIB_READER = from_source("file", earthkit_test_data_file("test_single.grib"))
-    ek_reader_result = WRAPPED_XR_ONES_LIKE(EK_GRIB_READER)
+    ek_reader_result = WRAPPED_XR_ONES_LIKE(ek_grib_reader)
     # Will return a DataSet becuase that is first value in kwarg_types
     assert isinstance(ek_reader_result, xr.Dataset)
-    assert ek_reader_result.equals(xr.ones_like(EK_GRIB_READER.to_xarray()))
+    assert ek_reader_result.equals(xr.ones_like(ek_grib_reader.to_xarray()))
 
 
-def test_transform_function_inputs_reader_to_xarray_typesetting():
+def test_transform_function_inputs_reader_to_xarray_typesetting(ek_grib_reader):
     # Check EK GribReader object
-    EK_GRIB_READER = from_source("file", earthkit_test_data_file("test_single.grib"))
-    ek_reader_result = WRAPPED_XR_ONES_LIKE_TYPE_SETTING(EK_GRIB_READER)
+    ek_reader_result = WRAPPED_XR_ONES_LIKE_TYPE_SETTING(ek_grib_reader)
     # Will return a dataarray because that is first value in type-set Union
     assert isinstance(ek_reader_result, xr.DataArray)
-    assert ek_reader_result.equals(xr.ones_like(EK_GRIB_READER.to_xarray()["2t"]))
+    assert ek_reader_result.equals(xr.ones_like(ek_grib_reader.to_xarray()["2t"]))
 
 
-def test_transform_module_inputs_reader_to_xarray():
+def test_transform_module_inputs_reader_to_xarray(ek_grib_reader):
     # Check EK GribReader object
-    EK_GRIB_READER = from_source("file", earthkit_test_data_file("test_single.grib"))
-    ek_reader_result = WRAPPED_DUMMY_MODULE.xarray_ones_like(EK_GRIB_READER)
+    ek_reader_result = WRAPPED_DUMMY_MODULE.xarray_ones_like(ek_grib_reader)
     # Data array because type-setting of function has dataarray first
     assert isinstance(ek_reader_result, xr.DataArray)
-    assert ek_reader_result.equals(xr.ones_like(EK_GRIB_READER.to_xarray())["2t"])
+    assert ek_reader_result.equals(xr.ones_like(ek_grib_reader.to_xarray())["2t"])
 
 
 def test_transform_function_inputs_wrapper_to_xarray():
@@ -106,26 +110,23 @@ def test_transform_module_inputs_wrapper_to_xarray():
     assert ek_wrapper_result.equals(xr.ones_like(TEST_DA))
 
 
-def test_transform_function_inputs_reader_to_numpy():
+def test_transform_function_inputs_reader_to_numpy(ek_grib_reader):
     # Test with Earthkit.data GribReader object
-    EK_GRIB_READER = from_source("file", earthkit_test_data_file("test_single.grib"))
-    assert WRAPPED_NP_MEAN(EK_GRIB_READER) == np.mean(EK_GRIB_READER.to_numpy())
-    assert isinstance(WRAPPED_NP_MEAN(EK_GRIB_READER), np.float64)
+    assert WRAPPED_NP_MEAN(ek_grib_reader) == np.mean(ek_grib_reader.to_numpy())
+    assert isinstance(WRAPPED_NP_MEAN(ek_grib_reader), np.float64)
 
 
-def test_transform_function_inputs_reader_to_numpy_typesetting():
+def test_transform_function_inputs_reader_to_numpy_typesetting(ek_grib_reader):
     # Test with Earthkit.data GribReader object
-    EK_GRIB_READER = from_source("file", earthkit_test_data_file("test_single.grib"))
-    result = WRAPPED_NP_MEAN_TYPE_SETTING(EK_GRIB_READER)
-    assert result == np.mean(EK_GRIB_READER.to_numpy())
+    result = WRAPPED_NP_MEAN_TYPE_SETTING(ek_grib_reader)
+    assert result == np.mean(ek_grib_reader.to_numpy())
     assert isinstance(result, np.float64)
 
 
-def test_transform_module_inputs_reader_to_numpy():
+def test_transform_module_inputs_reader_to_numpy(ek_grib_reader):
     # Test with Earthkit.data GribReader object
-    EK_GRIB_READER = from_source("file", earthkit_test_data_file("test_single.grib"))
-    result = WRAPPED_DUMMY_MODULE.numpy_mean(EK_GRIB_READER)
-    assert result == np.mean(EK_GRIB_READER.to_numpy())
+    result = WRAPPED_DUMMY_MODULE.numpy_mean(ek_grib_reader)
+    assert result == np.mean(ek_grib_reader.to_numpy())
     assert isinstance(result, np.float64)
 
 
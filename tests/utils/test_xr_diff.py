@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+
+import pytest
+
+from earthkit.data.utils.xarray.diff import DictDiff
+from earthkit.data.utils.xarray.diff import DictDiffInfo
+from earthkit.data.utils.xarray.diff import ListDiff
+
+
+@pytest.mark.parametrize(
+    "vals1,vals2,same,diff_index",
+    [
+        ([], [], True, -1),
+        ([1, 2, 3], [1, 2, 3], True, -1),
+        ((1, 2, 3), [1, 2, 4], False, 2),
+        ([1.0, 2.5, float("inf")], [1.0, 2.5 + 1e-12, float("inf")], True, -1),
+        ([1.0, 2.5, 3.0], [1.0, 2.6, 3.0], False, 1),
+        ([1.0, float("nan")], [1.0, float("nan")], False, 1),
+        ([1.0, float("inf")], [1.0, float("-inf")], False, 1),
+        ([1.0, float("-inf")], [1.0, float("-inf")], True, -1),
+        ([1.0, float("inf")], [1.0, 2.0], False, 1),
+        ([1.0, 2.0], [1.0, float("-inf")], False, 1),
+        ([1, 2], [1.0, 2.0], False, 0),
+        ([1, 2.0], [1, 2], False, 1),
+        (["a", "b"], ["a", "b"], True, -1),
+        (["a", "b"], ["a", "c"], False, 1),
+        (("a", "b"), ["a", "b"], True, -1),
+        ([2**70, 1], [2**70, 1], True, -1),
+        ([True, 1], [1, 1], True, -1),
+        ([1, 2], [1, 2, 3], False, -1),
+    ],
+)
+def test_xr_list_diff(vals1, vals2, same, diff_index):
+    r = ListDiff.diff(vals1, vals2)
+    assert r.same == same
+    assert r.diff_index == diff_index
+
+
+def test_xr_list_diff_float_mismatch():
+    vals1 = [float(x) for x in range(100)]
+    vals2 = list(vals1)
+    vals2[70] += 1e-12
+    assert ListDiff.diff(vals1, vals2).same
+
+    vals2[80] = 81.0
+    r = ListDiff.diff(vals1, vals2, name="lat")
+    assert not r.same
+    assert r.diff_index == 80
+    assert r.diff_text == "Value mismatch at lat[80]: 80.0 != 81.0"
+
+    vals2[10] = float("inf")
+    r = ListDiff.diff(vals1, vals2, name="lat")
+    assert not r.same
+    assert r.diff_index == 10
+    assert r.diff_text == "Value mismatch at lat[10]: 10.0 != inf"
+
+
+@pytest.mark.parametrize(
+    "v1,v2,same",
+    [
+        (1.0, 1.0, True),
+        (1.0, 1.0 + 1e-12, True),
+        (1.0, 1.1, False),
+        (float("inf"), float("inf"), True),
+        (float("inf"), float("-inf"), False),
+        (float("inf"), 1.0, False),
+        (float("nan"), float("nan"), False),
+    ],
+)
+def test_xr_list_diff_compare_float(v1, v2, same):
+    assert ListDiff._compare(v1, v2) == (same, ListDiff.VALUE_DIFF)
+
+
+def test_xr_dict_diff():
+    d = {"a": 1, "b": "x"}
+    r = DictDiff.diff(d, d)
+    assert isinstance(r, DictDiffInfo)
+    assert r.same
+    assert r.diff_text == ""
+
+    r = DictDiff.diff(d, {"a": 1, "b": "x"})
+    assert r.same
+
+    r = DictDiff.diff(d, {"a": 2, "b": "x"})
+    assert not r.same
+    assert r.diff_dict == {"a": (2, 1)}
+    assert r.diff_text == "a: 2 != 1"
+
+    r = DictDiff.diff(d, {"a": 1, "c": "x"})
+    assert not r.same
+    assert r.diff_dict == {"b": (None, "x")}
+
+    r = DictDiff.diff(d, {"a": 1})
+    assert isinstance(r, DictDiffInfo)
+    assert not r.same
+    assert r.diff_text == "Length mismatch: 2 != 1"
+
+
+def test_xr_list_to_str():
+    from earthkit.data.utils.xarray.check import list_to_str
+
+    assert list_to_str([1, 2]) == "(2) [1, 2]"
+    assert list_to_str(tuple(range(20)), n=4) == "(20) [0, 1, 2, ..., 19]"
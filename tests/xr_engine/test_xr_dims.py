@@ -16,6 +16,7 @@ import pytest
 
 from earthkit.data import from_source
 from earthkit.data.testing import earthkit_remote_test_data_file
+from earthkit.data.testing import earthkit_test_data_file
 from earthkit.data.utils.xarray.profile import Profile
 
 here = os.path.dirname(__file__)
@@ -339,3 +340,18 @@ def test_xr_rename_dims(kwargs, dim_keys):
 
     for v in ds:
         compare_dim_order(ds, dim_keys, v)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"extra_dims": ["valid_time"]},
+        {"ensure_dims": ["valid_time"]},
+        {"time_dim_mode": "raw", "extra_dims": ["valid_time"]},
+    ],
+)
+def test_xr_dims_extra_dim_named_as_time_mode(kwargs):
+    ds_ek = from_source("file", earthkit_test_data_file("t_time_series.grib"))
+    ds = ds_ek.to_xarray(squeeze=False, **kwargs)
+
+    assert set(ds.dims) == {"number", "step", "levelist", "levtype", "latitude", "longitude"}